@@ -61,6 +61,20 @@ function yprompt {
 	fi
 }
 
+function abort_with_message {
+	X_MESSAGE=$1
+	shift
+	kill "$@" 2> /dev/null
+	fail_with_message "$X_MESSAGE"
+}
+
+function interrupted {
+	kill $(jobs -p) 2> /dev/null
+	fail_with_message "Interrupted"
+}
+
+trap interrupted INT
+
 function st {
 	SECONDS=0
 }
@@ -69,8 +83,12 @@ function et {
 	echo "Execution time: ${SECONDS}s" 
 }
 
-command -v wget || fail_with_message "wget not found"
-command -v gpg || fail_with_message "gpg not found"
+X_MISSING=
+for X_CMD in java mvn git svn wget gpg unzip
+do
+	command -v $X_CMD > /dev/null || X_MISSING="$X_MISSING $X_CMD"
+done
+[ -z "$X_MISSING" ] || fail_with_message "Commands not found:$X_MISSING"
 
 message "Checking Java version"
 java -version
@@ -93,20 +111,24 @@ et
 
 message "Making git folder"
 st
-rm -rf $X_STAGING
+if [ -d $X_STAGING ]
+then
+	mv $X_STAGING $X_STAGING-old-$$ || fail_with_message "Could not move $X_STAGING aside"
+fi
+rm -rf $X_STAGING-old-* &
 mkdir -p $X_STAGING
 mkdir $X_STAGING/git
 cd $X_STAGING/git
 et
 
-message "Cloning juneau.git"
+message "Cloning juneau.git and juneau-website.git"
 st
-git clone https://gitbox.apache.org/repos/asf/juneau.git
-et
-
-message "Cloning juneau-website.git"
-st
-git clone https://gitbox.apache.org/repos/asf/juneau-website.git
+git clone https://gitbox.apache.org/repos/asf/juneau.git &
+X_PID1=$!
+git clone https://gitbox.apache.org/repos/asf/juneau-website.git &
+X_PID2=$!
+wait $X_PID1 || abort_with_message "Could not clone juneau.git" $X_PID1 $X_PID2
+wait $X_PID2 || abort_with_message "Could not clone juneau-website.git" $X_PID1 $X_PID2
 et
 
 cd juneau
@@ -130,31 +152,42 @@ WORKSPACE=target/workspace
 XV=${X_VERSION}-SNAPSHOT
 rm -Rf $WORKSPACE
 mkdir -p $WORKSPACE
+X_PIDS=
 
 ZIP_SRC=juneau-microservice/juneau-my-jetty-microservice/target/my-jetty-microservice-$XV-bin.zip
 ZIP_TGT=$WORKSPACE/my-jetty-microservice
 echo Unzipping $ZIP_SRC to $ZIP_TGT
-unzip -o $ZIP_SRC -d $ZIP_TGT
+unzip -q -o $ZIP_SRC -d $ZIP_TGT &
+X_PIDS="$X_PIDS $!"
 
 ZIP_SRC=juneau-microservice/juneau-my-springboot-microservice/target/my-springboot-microservice-$XV-bin.zip
 ZIP_TGT=$WORKSPACE/my-springboot-microservice
 echo Unzipping $ZIP_SRC to $ZIP_TGT
-unzip -o $ZIP_SRC -d $ZIP_TGT
+unzip -q -o $ZIP_SRC -d $ZIP_TGT &
+X_PIDS="$X_PIDS $!"
 
 ZIP_SRC=juneau-examples/juneau-examples-core/target/juneau-examples-core-$XV-bin.zip
 ZIP_TGT=$WORKSPACE/juneau-examples-core
 echo Unzipping $ZIP_SRC to $ZIP_TGT
-unzip -o $ZIP_SRC -d $ZIP_TGT
+unzip -q -o $ZIP_SRC -d $ZIP_TGT &
+X_PIDS="$X_PIDS $!"
 
 ZIP_SRC=juneau-examples/juneau-examples-rest-jetty/target/juneau-examples-rest-jetty-$XV-bin.zip
 ZIP_TGT=$WORKSPACE/juneau-examples-rest-jetty
 echo Unzipping $ZIP_SRC to $ZIP_TGT
-unzip -o $ZIP_SRC -d $ZIP_TGT
+unzip -q -o $ZIP_SRC -d $ZIP_TGT &
+X_PIDS="$X_PIDS $!"
 
 ZIP_SRC=juneau-examples/juneau-examples-rest-springboot/target/juneau-examples-rest-springboot-$XV-bin.zip
 ZIP_TGT=$WORKSPACE/juneau-examples-rest-springboot
 echo Unzipping $ZIP_SRC to $ZIP_TGT
-unzip -o $ZIP_SRC -d $ZIP_TGT
+unzip -q -o $ZIP_SRC -d $ZIP_TGT &
+X_PIDS="$X_PIDS $!"
+
+for X_PID in $X_PIDS
+do
+	wait $X_PID || abort_with_message "Could not unzip workspace projects" $X_PIDS
+done
 
 yprompt "Can all workspace projecs in $X_STAGING/git/juneau/target/workspace be cleanly imported as Maven projects into Eclipse?"
 
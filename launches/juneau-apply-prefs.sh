@@ -12,7 +12,7 @@
 # * specific language governing permissions and limitations under the License.                                              *
 # ***************************************************************************************************************************
 
-projects=( 
+source_projects=( 
 "juneau-core/juneau-config"
 "juneau-core/juneau-dto"
 "juneau-core/juneau-marshall"
@@ -37,14 +37,7 @@ projects=(
 "juneau-sc/juneau-sc-server"
 )
 
-for i in "${projects[@]}"
-do
-	echo Preferences applied to $i
-	cp eclipse-preferences/source-prefs/org.eclipse.jdt.core.prefs $i/.settings
-	cp eclipse-preferences/source-prefs/org.eclipse.jdt.ui.prefs $i/.settings
-done
-
-projects=( 
+test_projects=( 
 "juneau-core/juneau-core-utest"
 "juneau-examples/juneau-examples-rest-jetty-ftest"
 "juneau-microservice/juneau-microservice-ftest"
@@ -53,10 +46,46 @@ projects=(
 "juneau-rest/juneau-rest-server-utest"
 )
 
-for i in "${projects[@]}"
+for i in "${source_projects[@]}" "${test_projects[@]}"
 do
-	echo Preferences applied to $i
-	cp eclipse-preferences/test-prefs/org.eclipse.jdt.core.prefs $i/.settings
-	cp eclipse-preferences/test-prefs/org.eclipse.jdt.ui.prefs $i/.settings
+	[ -d "$i" ] || { echo "Skipping missing project $i"; continue; }
+	mkdir -p "$i/.settings"
 done
 
+failures=0
+
+function apply_prefs {
+	prefs=$1
+	shift
+	projects=()
+	pids=()
+	for i in "$@"
+	do
+		[ -d "$i" ] || continue
+		(
+			cmp -s $prefs/org.eclipse.jdt.core.prefs $i/.settings/org.eclipse.jdt.core.prefs || cp $prefs/org.eclipse.jdt.core.prefs $i/.settings || exit 1
+			cmp -s $prefs/org.eclipse.jdt.ui.prefs $i/.settings/org.eclipse.jdt.ui.prefs || cp $prefs/org.eclipse.jdt.ui.prefs $i/.settings
+		) &
+		projects+=("$i")
+		pids+=($!)
+	done
+	for n in "${!pids[@]}"
+	do
+		if wait ${pids[$n]}
+		then
+			echo Preferences applied to ${projects[$n]}
+		else
+			echo Preferences FAILED for ${projects[$n]}
+			failures=$((failures + 1))
+		fi
+	done
+}
+
+apply_prefs eclipse-preferences/source-prefs "${source_projects[@]}"
+apply_prefs eclipse-preferences/test-prefs "${test_projects[@]}"
+
+if [ $failures -ne 0 ]
+then
+	echo "Preferences could not be applied to $failures project(s)"
+	exit 1
+fi
@@ -12,7 +12,7 @@
 # ***************************************************************************************************************************
 
 . launches/juneau-env.sh
-mvn clean install
+mvn -T 1C clean install
 . juneau-build-javadoc.sh
 
 echo '*******************************************************************************'
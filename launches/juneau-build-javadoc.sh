@@ -24,10 +24,15 @@ cd juneau-doc
 java -cp target/juneau-doc-${JUNEAU_VERSION}-SNAPSHOT.jar org.apache.juneau.doc.internal.DocLinkTester
 cd .. 
 
-rm -rf ../juneau-website/content/site/apidocs-$JUNEAU_VERSION
+if [ -d ../juneau-website/content/site/apidocs-$JUNEAU_VERSION ]
+then
+	mv ../juneau-website/content/site/apidocs-$JUNEAU_VERSION ../juneau-website/content/site/apidocs-$JUNEAU_VERSION-old-$$
+fi
+rm -rf ../juneau-website/content/site/apidocs-$JUNEAU_VERSION-old-* &
 mkdir ../juneau-website/content/site/apidocs-$JUNEAU_VERSION
-cp -r ./target/site/apidocs/* ../juneau-website/content/site/apidocs-$JUNEAU_VERSION
+cp -a ./target/site/apidocs/. ../juneau-website/content/site/apidocs-$JUNEAU_VERSION
 find ../juneau-website/content/site/apidocs-$JUNEAU_VERSION -type f -name '*.html' -exec sed -i '' s/-SNAPSHOT// {} +
+wait
 
 echo '*******************************************************************************'
 echo '***** SUCCESS *****************************************************************'